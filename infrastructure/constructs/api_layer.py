@@ -36,7 +36,8 @@ class ApiLayerConstruct(Construct):
     ) -> None:
         super().__init__(scope, construct_id)
 
-        # AWS-managed Powertools layer (includes pydantic, boto3 extras)
+        # AWS-managed Powertools layer. Logging no longer uses Powertools, but the
+        # layer still supplies pydantic, which requirements-lambda.txt does not bundle.
         # Using x86_64 for CI/CD compatibility (GitHub runners are x86_64)
         powertools_layer = _lambda.LayerVersion.from_layer_version_arn(
             self,
@@ -3,8 +3,8 @@ Event pipeline: S3 -> EventBridge -> Lambda to trigger KB sync.
 """
 
 from aws_cdk import (
+    BundlingOptions,
     Duration,
-    Stack,
     aws_events as events,
     aws_events_targets as targets,
     aws_lambda as _lambda,
@@ -29,21 +29,27 @@ class EventPipelineConstruct(Construct):
     ) -> None:
         super().__init__(scope, construct_id)
 
-        # Use AWS-managed Powertools layer
+        # Bundle with requirements-lambda.txt: the shared logger needs orjson.
+        # No Powertools layer; this handler uses neither Powertools nor pydantic.
         # Using x86_64 for CI/CD compatibility (GitHub runners are x86_64)
-        powertools_layer = _lambda.LayerVersion.from_layer_version_arn(
-            self,
-            "SyncPowertoolsLayer",
-            f"arn:aws:lambda:{Stack.of(self).region}:017000801446:layer:AWSLambdaPowertoolsPythonV3-python312-x86:7"
+        bundled_code = _lambda.Code.from_asset(
+            "src",
+            bundling=BundlingOptions(
+                image=_lambda.Runtime.PYTHON_3_12.bundling_image,
+                command=[
+                    "bash", "-c",
+                    "pip install -r requirements-lambda.txt -t /asset-output && "
+                    "cp -r . /asset-output"
+                ],
+            ),
         )
-        
+
         self.sync_lambda = _lambda.Function(
             self,
             "KbSyncHandler",
             runtime=_lambda.Runtime.PYTHON_3_12,
             handler="handlers.kb_sync.lambda_handler",
-            code=_lambda.Code.from_asset("src"),
-            layers=[powertools_layer],
+            code=bundled_code,
             timeout=Duration.seconds(60),
             memory_size=256,
             architecture=_lambda.Architecture.X86_64,
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import json
 import uuid
+from contextvars import ContextVar
 from typing import Dict, Optional
 
 from models.agent import ClassificationResult, TicketInput
@@ -19,10 +20,19 @@ logger = get_logger(__name__)
 # Lazy-loaded service to avoid import-time issues
 _classifier: Optional["ClassificationService"] = None
 
+# Per-context override so callers/tests can inject a ClassificationService without
+# mutating module state.
+_classifier_override: ContextVar[Optional["ClassificationService"]] = ContextVar(
+    "classifier_override", default=None
+)
+
 
 def _get_classifier():
-    """Lazy-load ClassificationService."""
+    """Return the injected ClassificationService, else lazy-load the shared one."""
     global _classifier
+    override = _classifier_override.get()
+    if override is not None:
+        return override
     if _classifier is None:
         from services.classification_service import ClassificationService
         _classifier = ClassificationService()
@@ -9,7 +9,17 @@ import boto3
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
-client = boto3.client("bedrock-agent")
+
+# Lazy-loaded client so importing this module does not create AWS clients
+_client = None
+
+
+def _get_client():
+    """Lazy-load Bedrock Agent client."""
+    global _client
+    if _client is None:
+        _client = boto3.client("bedrock-agent")
+    return _client
 
 
 def lambda_handler(event, context):
@@ -18,7 +28,7 @@ def lambda_handler(event, context):
     data_source_id = os.environ["DATA_SOURCE_ID"]
 
     try:
-        resp = client.start_ingestion_job(
+        resp = _get_client().start_ingestion_job(
             knowledgeBaseId=knowledge_base_id,
             dataSourceId=data_source_id,
         )
@@ -10,6 +10,7 @@ from __future__ import annotations
 import json
 import os
 import uuid
+from contextvars import ContextVar
 from typing import Dict, Optional
 
 import boto3
@@ -23,10 +24,19 @@ logger = get_logger(__name__)
 _orchestrator: Optional["OrchestrationService"] = None
 _sfn_client = None
 
+# Per-context override so callers/tests can inject an OrchestrationService without
+# mutating module state.
+_orchestrator_override: ContextVar[Optional["OrchestrationService"]] = ContextVar(
+    "orchestrator_override", default=None
+)
+
 
 def _get_orchestrator():
-    """Lazy-load OrchestrationService."""
+    """Return the injected OrchestrationService, else lazy-load the shared one."""
     global _orchestrator
+    override = _orchestrator_override.get()
+    if override is not None:
+        return override
     if _orchestrator is None:
         from services.orchestration_service import OrchestrationService
         _orchestrator = OrchestrationService()
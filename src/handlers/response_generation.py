@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import uuid
+from contextvars import ContextVar
 from typing import Dict, Optional
 
 from models.agent import (
@@ -23,10 +24,19 @@ logger = get_logger(__name__)
 # Lazy-loaded service to avoid import-time issues
 _responder: Optional["ResponseService"] = None
 
+# Per-context override so callers/tests can inject a ResponseService without
+# mutating module state.
+_responder_override: ContextVar[Optional["ResponseService"]] = ContextVar(
+    "responder_override", default=None
+)
+
 
 def _get_responder():
-    """Lazy-load ResponseService."""
+    """Return the injected ResponseService, else lazy-load the shared one."""
     global _responder
+    override = _responder_override.get()
+    if override is not None:
+        return override
     if _responder is None:
         from services.response_service import ResponseService
         _responder = ResponseService()
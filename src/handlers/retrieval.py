@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import uuid
+from contextvars import ContextVar
 from typing import Dict, Optional
 
 from models.agent import ClassificationResult, RetrievalResult, TicketInput
@@ -18,10 +19,19 @@ logger = get_logger(__name__)
 # Lazy-loaded service to avoid import-time issues
 _retriever: Optional["RetrievalService"] = None
 
+# Per-context override so callers/tests can inject a RetrievalService without
+# mutating module state.
+_retriever_override: ContextVar[Optional["RetrievalService"]] = ContextVar(
+    "retriever_override", default=None
+)
+
 
 def _get_retriever():
-    """Lazy-load RetrievalService."""
+    """Return the injected RetrievalService, else lazy-load the shared one."""
     global _retriever
+    override = _retriever_override.get()
+    if override is not None:
+        return override
     if _retriever is None:
         from services.retrieval_service import RetrievalService
         _retriever = RetrievalService()
@@ -8,11 +8,12 @@ added later without changing the contract.
 
 from __future__ import annotations
 
-import json
 import time
 import uuid
 from typing import Dict, Optional
 
+import orjson
+
 from models.ticket import TicketRequest, TicketResponse
 from utils.logging_config import get_logger
 
@@ -47,8 +48,8 @@ def lambda_handler(event, context):
     correlation_id = str(uuid.uuid4())
 
     try:
-        payload = json.loads(event.get("body") or "{}")
-        ticket = TicketRequest.model_validate(payload)
+        # Parse and validate in one pass with the model's prebuilt validator.
+        ticket = TicketRequest.model_validate_json(event.get("body") or "{}")
 
         # Fetch customer context (uses cache + DB/DynamoDB).
         customer_context = _get_customer_service().get_customer_context(
@@ -86,13 +87,13 @@ def lambda_handler(event, context):
         return {
             "statusCode": 400,
             "headers": {"Content-Type": "application/json"},
-            "body": json.dumps(
+            "body": orjson.dumps(
                 {
                     "message": "Invalid request",
                     "error": str(exc),
                     "correlation_id": correlation_id,
                 }
-            ),
+            ).decode(),
         }
 
 
@@ -101,5 +102,5 @@ def feedback_handler(event, context):
     return {
         "statusCode": 200,
         "headers": {"Content-Type": "application/json"},
-        "body": json.dumps({"status": "accepted"}),
+        "body": orjson.dumps({"status": "accepted"}).decode(),
     }
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import time
 from datetime import datetime, timezone
-from typing import List
+from typing import List, Optional, Tuple
 
 from models.agent import (
     ClassificationResult,
@@ -26,14 +26,33 @@ from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Stage services are shared across orchestrator instances so their boto3 clients
+# (and connection pools) survive orchestrator rebuilds on warm invocations.
+# Sharing relies on Lambda running one invocation per process at a time; the
+# services (RetrievalService in particular) are not thread-safe, so do not
+# call OrchestrationService from several threads.
+_classifier: Optional[ClassificationService] = None
+_retriever: Optional[RetrievalService] = None
+_responder: Optional[ResponseService] = None
+
+
+def _get_stage_services() -> Tuple[ClassificationService, RetrievalService, ResponseService]:
+    """Lazy-create the shared stage services once per process."""
+    global _classifier, _retriever, _responder
+    if _classifier is None:
+        _classifier = ClassificationService()
+    if _retriever is None:
+        _retriever = RetrievalService()
+    if _responder is None:
+        _responder = ResponseService()
+    return _classifier, _retriever, _responder
+
 
 class OrchestrationService:
     """Sequential orchestration that mirrors the state machine."""
 
     def __init__(self) -> None:
-        self.classifier = ClassificationService()
-        self.retriever = RetrievalService()
-        self.responder = ResponseService()
+        self.classifier, self.retriever, self.responder = _get_stage_services()
 
     def run(self, ticket: TicketInput, correlation_id: str) -> OrchestrationResult:
         """Run classification -> retrieval -> generation with timing trace."""
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import time
 from typing import List
 
@@ -26,6 +27,10 @@ from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Phrases that promise more than the SLA allows; matched case-insensitively.
+_OFF_BRAND_TERMS = ("guarantee",)
+_OFF_BRAND_RE = re.compile("|".join(map(re.escape, _OFF_BRAND_TERMS)), re.IGNORECASE)
+
 
 class ResponseService:
     """Generate drafts with basic guardrail logic."""
@@ -91,7 +96,7 @@ class ResponseService:
             alternative = None
 
         # Post-generation guardrails: ensure no promises beyond SLA.
-        if "guarantee" in primary.text.lower():
+        if _OFF_BRAND_RE.search(primary.text):
             guardrail_triggered = True
             flags.append(SafetyFlag.OFF_BRAND)
             primary.safety_flags.append(SafetyFlag.OFF_BRAND)
@@ -116,13 +121,10 @@ class ResponseService:
         retrieval: RetrievalResult,
     ) -> str:
         """Construct a concise prompt with citations to minimize tokens."""
-        context_lines = []
-        for item in retrieval.context_package[:5]:
-            context_lines.append(
-                f"- [{item.type}] ({item.score:.2f}) {item.excerpt} (cite: {item.citation_uri})"
-            )
-
-        context_block = "\n".join(context_lines) or "No context available."
+        context_block = "\n".join(
+            f"- [{item.type}] ({item.score:.2f}) {item.excerpt} (cite: {item.citation_uri})"
+            for item in retrieval.context_package[:5]
+        ) or "No context available."
         return (
             "You are a concise, empathetic support assistant. "
             "Write 2 drafts separated by '\\n---\\n'. "
@@ -139,9 +141,17 @@ class ResponseService:
 
         We expect drafts separated by ---; if not present, treat entire text as one draft.
         """
-        parts = [p.strip() for p in text.split("---") if p.strip()]
-        primary_text = parts[0] if parts else text
-        alternative_text = parts[1] if len(parts) > 1 else None
+        # Partition only until two non-empty drafts are found; empty segments
+        # (leading or repeated separators) are skipped.
+        drafts: list[str] = []
+        rest = text
+        while rest and len(drafts) < 2:
+            segment, _, rest = rest.partition("---")
+            segment = segment.strip()
+            if segment:
+                drafts.append(segment)
+        primary_text = drafts[0] if drafts else text
+        alternative_text = drafts[1] if len(drafts) > 1 else None
 
         primary = ResponseDraft(
             text=primary_text, citations=[], confidence=0.65, safety_flags=[]
@@ -9,6 +9,7 @@ Designed to stay cost-aware by:
 
 from __future__ import annotations
 
+import json
 import time
 from typing import List
 
@@ -25,9 +26,38 @@ from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+_SLA_BY_PRIORITY = {
+    "critical": "1h response, 4h resolution",
+    "high": "4h response, 1d resolution",
+    "medium": "1d response, 2d resolution",
+    "low": "2d response, 5d resolution",
+}
+
+# (is_enterprise, priority) -> SLA excerpt, built once so the hot path is a dict lookup.
+_SLA_TABLE: dict[tuple[bool, str], str] = {
+    (is_enterprise, priority): (
+        f"SLA: {window}. Expedite for enterprise tier."
+        if is_enterprise
+        else f"SLA: {window}."
+    )
+    for is_enterprise in (True, False)
+    for priority, window in _SLA_BY_PRIORITY.items()
+}
+# Fallback for unmapped priorities, still keyed on is_enterprise.
+_DEFAULT_SLA = {
+    True: "SLA: 1d response. Expedite for enterprise tier.",
+    False: "SLA: 1d response.",
+}
+
 
 class RetrievalService:
-    """Build a context package suitable for generation."""
+    """
+    Build a context package suitable for generation.
+
+    Not thread-safe: an instance shares one CustomerService (boto3 DynamoDB
+    resource) and one BedrockService (plain-dict cache). Use a separate
+    instance per thread.
+    """
 
     def __init__(self) -> None:
         self.kb = BedrockService()
@@ -148,19 +178,11 @@ class RetrievalService:
         return [sample]
 
     def _derive_sla(self, tier: str, priority: str) -> str:
-        """Derive a simple SLA string based on tier and priority."""
-        base = {
-            "critical": "1h response, 4h resolution",
-            "high": "4h response, 1d resolution",
-            "medium": "1d response, 2d resolution",
-            "low": "2d response, 5d resolution",
-        }
-        tier_bonus = "Expedite for enterprise tier." if tier == "enterprise" else ""
-        return f"SLA: {base.get(str(priority), '1d response')}. {tier_bonus}".strip()
+        """Look up the precomputed SLA string for tier and priority."""
+        is_enterprise = tier == "enterprise"
+        return _SLA_TABLE.get((is_enterprise, priority), _DEFAULT_SLA[is_enterprise])
 
 
 def json_dumps_compact(obj: object) -> str:
     """Compact JSON helper to keep excerpts small."""
-    import json
-
     return json.dumps(obj, separators=(",", ":"))
@@ -5,34 +5,51 @@ Lightweight caching layer to reduce external calls.
 Survives across warm Lambda invocations.
 """
 
+import time
 from collections import OrderedDict
-from datetime import datetime, timedelta
 from threading import Lock
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 
 class LRUCache:
-    """Thread-safe LRU cache with TTL support."""
+    """Thread-safe LRU cache with TTL support.
 
-    def __init__(self, max_size: int = 100, ttl_seconds: int = 300):
+    Expiry uses a monotonic clock so wall-clock adjustments cannot expire or
+    resurrect entries; pass ``time_fn`` to drive the clock from tests.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 100,
+        ttl_seconds: int = 300,
+        time_fn: Callable[[], float] = time.monotonic,
+    ):
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
-        self._cache: OrderedDict[str, tuple[Any, datetime]] = OrderedDict()
+        self._time = time_fn
+        # key -> (value, expires_at)
+        self._cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
         self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if exists and not expired."""
         with self._lock:
             if key not in self._cache:
+                self.misses += 1
                 return None
 
-            value, timestamp = self._cache[key]
+            value, expires_at = self._cache[key]
 
-            if datetime.utcnow() - timestamp > timedelta(seconds=self.ttl_seconds):
+            if self._time() > expires_at:
                 del self._cache[key]
+                self.misses += 1
                 return None
 
             self._cache.move_to_end(key)
+            self.hits += 1
             return value
 
     def set(self, key: str, value: Any) -> None:
@@ -40,10 +57,11 @@ class LRUCache:
         with self._lock:
             if key in self._cache:
                 self._cache.move_to_end(key)
-            self._cache[key] = (value, datetime.utcnow())
+            self._cache[key] = (value, self._time() + self.ttl_seconds)
 
             while len(self._cache) > self.max_size:
                 self._cache.popitem(last=False)
+                self.evictions += 1
 
     def delete(self, key: str) -> bool:
         """Delete key from cache."""
@@ -65,4 +83,7 @@ class LRUCache:
                 "size": len(self._cache),
                 "max_size": self.max_size,
                 "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
             }
@@ -3,6 +3,11 @@
 from dataclasses import dataclass
 from typing import Any, Dict
 
+import orjson
+
+# Shared across error responses; callers must not mutate it.
+_HEADERS = {"Content-Type": "application/json"}
+
 
 class AppError(Exception):
     """Base class for application errors."""
@@ -30,6 +35,6 @@ def to_response(error: AppError) -> Dict[str, Any]:
     """Convert an AppError into a Lambda proxy integration response."""
     return {
         "statusCode": error.status_code,
-        "headers": {"Content-Type": "application/json"},
-        "body": f'{{"message": "{error}", "status": "error"}}',
+        "headers": _HEADERS,
+        "body": orjson.dumps({"message": str(error), "status": "error"}).decode(),
     }
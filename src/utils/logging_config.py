@@ -1,25 +1,110 @@
 """Structured logger setup shared across Lambdas.
 
-Uses AWS Lambda Powertools Logger for structured JSON logging.
-This is included in the Powertools layer and provides:
-- Automatic correlation IDs
-- JSON formatted output for CloudWatch
-- Low overhead
+Writes one pre-serialized JSON object per line straight to stdout, which
+CloudWatch ingests as-is. Skipping the stdlib ``logging`` machinery (and the
+Powertools context injection layered on top of it) keeps per-line cost low on
+warm invocations:
+- No LogRecord allocation or formatter chain
+- orjson serializes the payload in a single C call
+- Levels below LOG_LEVEL are dropped before any work is done
 """
 
-from aws_lambda_powertools import Logger
+import os
+import sys
+import time
+import traceback
+from typing import Any, Dict, Optional
+
+import orjson
+
+_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+
+# Keys every record owns; caller-supplied values for these are prefixed with "extra_".
+_RESERVED_KEYS = frozenset({"level", "name", "msg", "ts"})
 
 # Cache loggers by name to avoid creating duplicates
-_loggers: dict = {}
+_loggers: Dict[str, "JsonLogger"] = {}
+
+
+class JsonLogger:
+    """Minimal JSON-lines logger with a Powertools-compatible call signature."""
+
+    def __init__(self, name: str, level: Optional[str] = None) -> None:
+        self.name = name
+        level_name = (level or os.environ.get("LOG_LEVEL", "INFO")).upper()
+        self.level = _LEVELS.get(level_name, _LEVELS["INFO"])
+
+    def _emit(
+        self,
+        level_name: str,
+        msg: str,
+        extra: Optional[Dict[str, Any]],
+        fields: Dict[str, Any],
+    ) -> None:
+        """Serialize a single record and write it to stdout."""
+        context: Dict[str, Any] = {}
+        if extra:
+            context.update(extra)
+        if fields:
+            context.update(fields)
+        if not _RESERVED_KEYS.isdisjoint(context):
+            # Keep caller data without letting it relabel the line.
+            context = {
+                (f"extra_{key}" if key in _RESERVED_KEYS else key): value
+                for key, value in context.items()
+            }
+        record = {
+            "level": level_name,
+            "name": self.name,
+            "msg": msg,
+            "ts": time.time(),
+            **context,
+        }
+        line = orjson.dumps(record, default=str) + b"\n"
+        buffer = getattr(sys.stdout, "buffer", None)
+        if buffer is not None:
+            buffer.write(line)
+        else:
+            # Text-only streams (e.g. redirect_stdout(io.StringIO())) have no buffer.
+            sys.stdout.write(line.decode())
+        sys.stdout.flush()
+
+    def debug(self, msg: str, extra: Optional[Dict[str, Any]] = None, **fields: Any) -> None:
+        """Log at DEBUG level."""
+        if self.level <= _LEVELS["DEBUG"]:
+            self._emit("DEBUG", msg, extra, fields)
+
+    def info(self, msg: str, extra: Optional[Dict[str, Any]] = None, **fields: Any) -> None:
+        """Log at INFO level."""
+        if self.level <= _LEVELS["INFO"]:
+            self._emit("INFO", msg, extra, fields)
+
+    def warning(self, msg: str, extra: Optional[Dict[str, Any]] = None, **fields: Any) -> None:
+        """Log at WARNING level."""
+        if self.level <= _LEVELS["WARNING"]:
+            self._emit("WARNING", msg, extra, fields)
+
+    def error(self, msg: str, extra: Optional[Dict[str, Any]] = None, **fields: Any) -> None:
+        """Log at ERROR level."""
+        if self.level <= _LEVELS["ERROR"]:
+            self._emit("ERROR", msg, extra, fields)
+
+    def exception(
+        self, msg: str, extra: Optional[Dict[str, Any]] = None, **fields: Any
+    ) -> None:
+        """Log at ERROR level with the active exception's traceback attached."""
+        if self.level <= _LEVELS["ERROR"]:
+            fields["exception"] = traceback.format_exc()
+            self._emit("ERROR", msg, extra, fields)
 
 
-def get_logger(name: str) -> Logger:
+def get_logger(name: str) -> JsonLogger:
     """
-    Get or create a Powertools Logger.
+    Get or create a JSON logger.
 
     Keeping logging lean reduces CloudWatch costs while retaining context.
-    Powertools Logger automatically formats as JSON for CloudWatch Insights.
+    Output is one JSON object per line, queryable with CloudWatch Insights.
     """
     if name not in _loggers:
-        _loggers[name] = Logger(service=name)
+        _loggers[name] = JsonLogger(name)
     return _loggers[name]
@@ -11,6 +11,7 @@ import sys
 from pathlib import Path
 
 import boto3
+import pytest
 
 
 def _ensure_paths_on_sys_path() -> None:
@@ -51,5 +52,14 @@ os.environ.setdefault("INTERACTIONS_TABLE", "test-interactions-table")
 os.environ.setdefault("MODEL_ID", "anthropic.claude-3-haiku-20240307-v1:0")
 os.environ.setdefault("DATA_SOURCE_ID", "test-data-source-id")
 
-# Create a default boto3 session so resources/clients do not error during import.
-boto3.setup_default_session(region_name="eu-west-2")
+
+@pytest.fixture(scope="session", autouse=True)
+def _aws_default_session() -> None:
+    """Create the default boto3 session once per test session.
+
+    botocore's loader already memoizes endpoint/partition data per session
+    instance, so building the session exactly once keeps that data loaded for
+    every test instead of re-reading it from disk. No src/ module creates a
+    client at import, so nothing has built the session before this runs.
+    """
+    boto3.setup_default_session(region_name="eu-west-2")
@@ -0,0 +1 @@
+"""Shared test data and helpers reused across unit test modules."""
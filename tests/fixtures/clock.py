@@ -0,0 +1,6 @@
+"""Fixed timestamp for test data that only needs a plausible datetime."""
+
+from datetime import datetime, timezone
+
+FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+FROZEN_NOW_ISO = FROZEN_NOW.isoformat()
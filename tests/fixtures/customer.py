@@ -0,0 +1,22 @@
+"""Sample customer data shared by handler tests."""
+
+from models.customer import CustomerContext
+from tests.fixtures.clock import FROZEN_NOW
+
+# Built once per session; handlers only read and serialize it.
+SAMPLE_CUSTOMER_CONTEXT = CustomerContext(
+    customer_id="123",
+    external_id="cust-ext-1",
+    name="Jane Doe",
+    email="jane@example.com",
+    company="Example Co",
+    tier="gold",
+    lifetime_value=12500.0,
+    total_orders=42,
+    recent_orders=[{"order_id": "o-1", "order_number": "1001", "total_amount": 199.0}],
+    open_tickets=1,
+    avg_sentiment=0.6,
+    last_interaction=FROZEN_NOW,
+    is_high_value=True,
+    churn_risk="medium",
+)
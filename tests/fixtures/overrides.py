@@ -0,0 +1,17 @@
+"""Inject stub services into handlers through their override ContextVars."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+@contextmanager
+def override_service(override_var: ContextVar, stub: T) -> Iterator[T]:
+    """Set a stub on a handler's override ContextVar and reset it afterwards."""
+    token = override_var.set(stub)
+    try:
+        yield stub
+    finally:
+        override_var.reset(token)
@@ -0,0 +1,24 @@
+"""
+Shared mock fixtures for unit tests.
+
+Mocks are spec'd against the real service classes so a typo in a stubbed
+method name fails loudly instead of returning another MagicMock.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.customer_service import CustomerService
+
+
+@pytest.fixture
+def bedrock_runtime_client() -> MagicMock:
+    """Stand-in for a boto3 bedrock-runtime client."""
+    return MagicMock(spec=["invoke_model"])
+
+
+@pytest.fixture
+def customer_service_mock() -> MagicMock:
+    """Stand-in for CustomerService (customer context lookups)."""
+    return MagicMock(spec=CustomerService)
@@ -3,18 +3,13 @@ Tests for the agentic workflow handlers.
 
 These tests mock the underlying services to test handler logic only.
 """
+import functools
 import json
-import sys
-from datetime import datetime, timezone
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
+import orjson
 import pytest
-
-# Add src to path
-SRC_PATH = Path(__file__).parent.parent.parent / "src"
-if str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
+from pydantic import TypeAdapter
 
 from models.agent import (
     Category,
@@ -28,51 +23,140 @@ from models.agent import (
     RetrievalResult,
     Sentiment,
 )
+from handlers import classification, orchestration, response_generation, retrieval
+from tests.fixtures.clock import FROZEN_NOW
+from tests.fixtures.overrides import override_service
+
+
+# Built once; handlers only read these, so every test can share them.
+_CLASSIFICATION_RESULT = ClassificationResult(
+    category=Category.BILLING,
+    priority=Priority.HIGH,
+    department="Billing",
+    sentiment=Sentiment.NEUTRAL,
+    confidence=0.9,
+    reasoning_snippet="Looks like billing.",
+)
+_EMPTY_CONTEXT = RetrievalResult(context_package=[], aggregate_confidence=0.5)
+
+# One adapter dumps both payload models in a single serializer call.
+_PAYLOAD_ADAPTER = TypeAdapter(tuple[ClassificationResult, RetrievalResult])
+_CLASSIFICATION_DUMP, _CONTEXT_DUMP = _PAYLOAD_ADAPTER.dump_python(
+    (_CLASSIFICATION_RESULT, _EMPTY_CONTEXT), mode="json"
+)
 
 
 def _classification_result() -> ClassificationResult:
-    return ClassificationResult(
-        category=Category.BILLING,
-        priority=Priority.HIGH,
-        department="Billing",
-        sentiment=Sentiment.NEUTRAL,
-        confidence=0.9,
-        reasoning_snippet="Looks like billing.",
-    )
+    return _CLASSIFICATION_RESULT
 
 
-def test_classification_handler_parses_ticket():
-    """Test classification handler parses ticket and returns result."""
-    from handlers import classification
-    
-    # Reset the lazy-loaded classifier
-    classification._classifier = None
-    
-    mock_service = MagicMock()
-    mock_service.classify.return_value = _classification_result()
-    
-    with patch.object(classification, '_get_classifier', return_value=mock_service):
-        payload = {
+# Event payloads are constant, so serialize them once instead of per test.
+_TICKET = {
+    "title": "Reset",
+    "description": "router issue",
+    "customer_external_id": "cust-1",
+}
+_CLASSIFY_EVENT = {
+    "body": json.dumps(
+        {
             "title": "Billing issue",
             "description": "Invoice incorrect",
             "customer_external_id": "cust-1",
         }
-        event = {"body": json.dumps(payload)}
-        resp = classification.lambda_handler(event, None)
-        
+    )
+}
+_RETRIEVAL_EVENT = {"ticket": _TICKET, "classification": _CLASSIFICATION_DUMP}
+_RESPONSE_EVENT = {
+    "body": json.dumps(
+        {
+            "ticket": _TICKET,
+            "classification": _CLASSIFICATION_DUMP,
+            "context": _CONTEXT_DUMP,
+        }
+    )
+}
+_ORCHESTRATE_EVENT = {
+    "body": json.dumps(
+        {
+            "title": "Billing",
+            "description": "Invoice wrong",
+            "customer_external_id": "cust-1",
+        }
+    )
+}
+
+
+@functools.cache
+def _orchestration_result() -> OrchestrationResult:
+    """Build the stub orchestration result once; handlers never mutate it."""
+    return OrchestrationResult(
+        classification=_classification_result(),
+        context=_EMPTY_CONTEXT,
+        generation=GenerationResult(
+            primary_draft=ResponseDraft(
+                text="Hi", citations=[], confidence=0.6, safety_flags=[]
+            ),
+            alternative_draft=None,
+            suggested_next_steps=[],
+            guardrail_triggered=False,
+        ),
+        next_actions=["Review"],
+        trace=OrchestrationTrace(
+            classification_latency_ms=1,
+            retrieval_latency_ms=1,
+            generation_latency_ms=1,
+            total_latency_ms=3,
+            state="completed",
+            started_at=FROZEN_NOW,
+            correlation_id="cid",
+        ),
+    )
+
+
+@functools.cache
+def _orchestration_result_json() -> str:
+    """Serialized form of the stub result, for comparing handler output."""
+    return _orchestration_result().model_dump_json()
+
+
+@pytest.fixture(scope="module")
+def stub_classifier():
+    with override_service(classification._classifier_override, MagicMock()) as stub:
+        yield stub
+
+
+@pytest.fixture(scope="module")
+def stub_retriever():
+    with override_service(retrieval._retriever_override, MagicMock()) as stub:
+        yield stub
+
+
+@pytest.fixture(scope="module")
+def stub_responder():
+    with override_service(response_generation._responder_override, MagicMock()) as stub:
+        yield stub
+
+
+@pytest.fixture(scope="module")
+def stub_orchestrator():
+    with override_service(orchestration._orchestrator_override, MagicMock()) as stub:
+        yield stub
+
+
+def test_classification_handler_parses_ticket(stub_classifier):
+    """Test classification handler parses ticket and returns result."""
+    stub_classifier.classify.return_value = _classification_result()
+
+    resp = classification.lambda_handler(_CLASSIFY_EVENT, None)
+
     assert resp["statusCode"] == 200
-    body = json.loads(resp["body"])
+    body = orjson.loads(resp["body"])
     assert body["category"] == "billing"
     assert body["priority"] == "high"
 
 
-def test_retrieval_handler_accepts_direct_event():
+def test_retrieval_handler_accepts_direct_event(stub_retriever):
     """Test retrieval handler accepts direct event from Step Functions."""
-    from handlers import retrieval
-    
-    # Reset the lazy-loaded retriever
-    retrieval._retriever = None
-    
     result = RetrievalResult(
         context_package=[
             RetrievalContextItem(
@@ -86,32 +170,29 @@ def test_retrieval_handler_accepts_direct_event():
         aggregate_confidence=0.8,
     )
     
-    mock_service = MagicMock()
-    mock_service.build_context.return_value = result
-    
-    with patch.object(retrieval, '_get_retriever', return_value=mock_service):
-        event = {
-            "ticket": {
-                "title": "Reset",
-                "description": "router issue",
-                "customer_external_id": "cust-1",
-            },
-            "classification": _classification_result().model_dump(mode="json"),
-        }
-        resp = retrieval.lambda_handler(event, None)
-        
+    stub_retriever.build_context.return_value = result
+
+    resp = retrieval.lambda_handler(_RETRIEVAL_EVENT, None)
+
     assert resp["statusCode"] == 200
-    body = json.loads(resp["body"])
+    body = orjson.loads(resp["body"])
     assert body["context_package"][0]["source_id"] == "kb-1"
 
 
-def test_response_generation_handler():
+def test_retrieval_handler_reuses_validated_classification(stub_retriever):
+    """In-process callers passing a model instance should not pay for revalidation."""
+    stub_retriever.build_context.return_value = _EMPTY_CONTEXT
+
+    event = {"ticket": _TICKET, "classification": _CLASSIFICATION_RESULT}
+    resp = retrieval.lambda_handler(event, None)
+
+    assert resp["statusCode"] == 200
+    passed = stub_retriever.build_context.call_args.kwargs["classification"]
+    assert passed is _CLASSIFICATION_RESULT
+
+
+def test_response_generation_handler(stub_responder):
     """Test response generation handler produces drafts."""
-    from handlers import response_generation
-    
-    # Reset the lazy-loaded responder
-    response_generation._responder = None
-    
     generation = GenerationResult(
         primary_draft=ResponseDraft(
             text="Draft 1", citations=["uri"], confidence=0.7, safety_flags=[]
@@ -121,71 +202,23 @@ def test_response_generation_handler():
         guardrail_triggered=False,
     )
     
-    mock_service = MagicMock()
-    mock_service.generate_response.return_value = generation
-    
-    with patch.object(response_generation, '_get_responder', return_value=mock_service):
-        payload = {
-            "ticket": {
-                "title": "Reset",
-                "description": "router issue",
-                "customer_external_id": "cust-1",
-            },
-            "classification": _classification_result().model_dump(mode="json"),
-            "context": RetrievalResult(context_package=[], aggregate_confidence=0.5).model_dump(mode="json"),
-        }
-        resp = response_generation.lambda_handler({"body": json.dumps(payload)}, None)
-        
+    stub_responder.generate_response.return_value = generation
+
+    resp = response_generation.lambda_handler(_RESPONSE_EVENT, None)
+
     assert resp["statusCode"] == 200
-    body = json.loads(resp["body"])
+    body = orjson.loads(resp["body"])
     assert body["primary_draft"]["text"] == "Draft 1"
 
 
-def test_orchestration_local_fallback(monkeypatch):
+def test_orchestration_local_fallback(monkeypatch, stub_orchestrator):
     """Test orchestration falls back to local execution without SFN ARN."""
-    from handlers import orchestration
-    
-    # Reset the lazy-loaded orchestrator
-    orchestration._orchestrator = None
-    
-    now = datetime.now(timezone.utc)
-    orchestration_result = OrchestrationResult(
-        classification=_classification_result(),
-        context=RetrievalResult(context_package=[], aggregate_confidence=0.5),
-        generation=GenerationResult(
-            primary_draft=ResponseDraft(
-                text="Hi", citations=[], confidence=0.6, safety_flags=[]
-            ),
-            alternative_draft=None,
-            suggested_next_steps=[],
-            guardrail_triggered=False,
-        ),
-        next_actions=["Review"],
-        trace=OrchestrationTrace(
-            classification_latency_ms=1,
-            retrieval_latency_ms=1,
-            generation_latency_ms=1,
-            total_latency_ms=3,
-            state="completed",
-            started_at=now,
-            correlation_id="cid",
-        ),
-    )
-    
     # No SFN ARN means local fallback
     monkeypatch.setenv("STATE_MACHINE_ARN", "")
     
-    mock_service = MagicMock()
-    mock_service.run.return_value = orchestration_result
-    
-    with patch.object(orchestration, '_get_orchestrator', return_value=mock_service):
-        payload = {
-            "title": "Billing",
-            "description": "Invoice wrong",
-            "customer_external_id": "cust-1",
-        }
-        resp = orchestration.lambda_handler({"body": json.dumps(payload)}, None)
-        
+    stub_orchestrator.run.return_value = _orchestration_result()
+
+    resp = orchestration.lambda_handler(_ORCHESTRATE_EVENT, None)
+
     assert resp["statusCode"] == 200
-    body = json.loads(resp["body"])
-    assert body["next_actions"] == ["Review"]
+    assert resp["body"] == _orchestration_result_json()
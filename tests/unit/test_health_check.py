@@ -1,7 +1,8 @@
-from src.handlers import health_check
+from handlers import health_check
 
 
 def test_health_check_returns_ok():
     resp = health_check.lambda_handler({}, None)
     assert resp["statusCode"] == 200
-    assert "ok" in resp["body"]
+    # The handler emits compact orjson output, so the pair has no spaces.
+    assert '"status":"ok"' in resp["body"]
@@ -8,128 +8,146 @@ Run with: pytest tests/unit/test_imports.py -v
 """
 
 import importlib
-import sys
+import mmap
+import os
+import re
 from pathlib import Path
-from unittest.mock import patch, MagicMock
 
 import pytest
 
 
-# Add src to path to simulate Lambda environment
-SRC_PATH = Path(__file__).parent.parent.parent / "src"
-if str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
+# src/ itself is put on sys.path by tests/conftest.py; this is only for file scans.
+SRC_PATH = Path(__file__).resolve().parents[2] / "src"
+
+HANDLER_MODULES = [
+    "handlers.main",
+    "handlers.health_check",
+    "handlers.ticket_ingestion",
+    "handlers.customer_context",
+    "handlers.kb_sync",
+    "handlers.classification",
+    "handlers.retrieval",
+    "handlers.response_generation",
+    "handlers.orchestration",
+]
+SERVICE_MODULES = [
+    "services.bedrock_service",
+    "services.customer_service",
+    "services.ticket_service",
+    "services.classification_service",
+    "services.retrieval_service",
+    "services.response_service",
+    "services.orchestration_service",
+]
+MODEL_MODULES = [
+    "models.agent",
+    "models.customer",
+    "models.knowledge",
+    "models.response",
+    "models.ticket",
+]
+UTIL_MODULES = [
+    "utils.logging_config",
+    "utils.cache_service",
+    "utils.error_handling",
+    "utils.validators",
+]
+ALL_MODULE_NAMES = HANDLER_MODULES + SERVICE_MODULES + MODEL_MODULES + UTIL_MODULES
+
+SRC_PREFIX_SUBDIRS = ("handlers", "services", "models", "utils")
+# One compiled pass catches both "from src." and "import src." forms.
+SRC_PREFIX_RE = re.compile(rb"(?:from|import)\s+src\.")
+
+
+@pytest.fixture(scope="session")
+def import_results():
+    """Import every module once, recording (module, error) per name.
+
+    Any exception is captured, not just ImportError, so a module that fails at
+    import time (e.g. a missing env var) is reported by its own test.
+    """
+    results = {}
+    for name in ALL_MODULE_NAMES:
+        try:
+            results[name] = (importlib.import_module(name), None)
+        except Exception as e:
+            results[name] = (None, e)
+    return results
+
+
+@pytest.fixture(scope="session")
+def src_prefix_scan():
+    """Scan each src/ package once for 'src.' imports, without decoding files.
+
+    Returns offending "file: matched text" entries keyed by subdirectory.
+    """
+    offenders = {}
+    for subdir in SRC_PREFIX_SUBDIRS:
+        found = []
+        with os.scandir(SRC_PATH / subdir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".py") or not entry.is_file(follow_symlinks=False):
+                    continue
+                with open(entry.path, "rb") as f:
+                    # mmap rejects empty files (e.g. bare __init__.py)
+                    if os.fstat(f.fileno()).st_size == 0:
+                        continue
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        match = SRC_PREFIX_RE.search(mm)
+                        if match:
+                            found.append(f"{entry.name}: {match.group().decode()}")
+        offenders[subdir] = found
+    return offenders
+
+
+def _module(import_results, module_name):
+    """Return the pre-imported module or fail with the recorded error."""
+    module, error = import_results[module_name]
+    assert error is None, f"Failed to import {module_name}: {error!r}"
+    return module
 
 
 class TestHandlerImports:
     """Verify all handler modules can be imported without errors."""
 
-    @pytest.mark.parametrize("module_name", [
-        "handlers.main",
-        "handlers.health_check",
-        "handlers.ticket_ingestion",
-        "handlers.customer_context",
-        "handlers.kb_sync",
-        "handlers.classification",
-        "handlers.retrieval",
-        "handlers.response_generation",
-        "handlers.orchestration",
-    ])
-    def test_handler_import(self, module_name: str):
+    @pytest.mark.parametrize("module_name", HANDLER_MODULES)
+    def test_handler_import(self, module_name: str, import_results):
         """Each handler module should import without errors."""
-        try:
-            module = importlib.import_module(module_name)
-            assert hasattr(module, "lambda_handler"), f"{module_name} missing lambda_handler"
-        except ImportError as e:
-            pytest.fail(f"Failed to import {module_name}: {e}")
+        module = _module(import_results, module_name)
+        assert hasattr(module, "lambda_handler"), f"{module_name} missing lambda_handler"
 
 
 class TestServiceImports:
     """Verify all service modules can be imported."""
 
-    @pytest.mark.parametrize("module_name", [
-        "services.bedrock_service",
-        "services.customer_service",
-        "services.ticket_service",
-        "services.classification_service",
-        "services.retrieval_service",
-        "services.response_service",
-        "services.orchestration_service",
-    ])
-    def test_service_import(self, module_name: str):
+    @pytest.mark.parametrize("module_name", SERVICE_MODULES)
+    def test_service_import(self, module_name: str, import_results):
         """Each service module should import without errors."""
-        try:
-            importlib.import_module(module_name)
-        except ImportError as e:
-            pytest.fail(f"Failed to import {module_name}: {e}")
+        _module(import_results, module_name)
 
 
 class TestModelImports:
     """Verify all model modules can be imported."""
 
-    @pytest.mark.parametrize("module_name", [
-        "models.agent",
-        "models.customer",
-        "models.knowledge",
-        "models.response",
-        "models.ticket",
-    ])
-    def test_model_import(self, module_name: str):
+    @pytest.mark.parametrize("module_name", MODEL_MODULES)
+    def test_model_import(self, module_name: str, import_results):
         """Each model module should import without errors."""
-        try:
-            importlib.import_module(module_name)
-        except ImportError as e:
-            pytest.fail(f"Failed to import {module_name}: {e}")
+        _module(import_results, module_name)
 
 
 class TestUtilImports:
     """Verify all utility modules can be imported."""
 
-    @pytest.mark.parametrize("module_name", [
-        "utils.logging_config",
-        "utils.cache_service",
-        "utils.error_handling",
-        "utils.validators",
-    ])
-    def test_util_import(self, module_name: str):
+    @pytest.mark.parametrize("module_name", UTIL_MODULES)
+    def test_util_import(self, module_name: str, import_results):
         """Each utility module should import without errors."""
-        try:
-            importlib.import_module(module_name)
-        except ImportError as e:
-            pytest.fail(f"Failed to import {module_name}: {e}")
+        _module(import_results, module_name)
 
 
 class TestNoSrcPrefix:
     """Ensure no modules use 'from src.' imports (breaks in Lambda)."""
 
-    def test_no_src_prefix_in_handlers(self):
-        """Handler files should not have 'from src.' imports."""
-        handlers_dir = SRC_PATH / "handlers"
-        for py_file in handlers_dir.glob("*.py"):
-            content = py_file.read_text()
-            assert "from src." not in content, f"{py_file.name} contains 'from src.' import"
-            assert "import src." not in content, f"{py_file.name} contains 'import src.' import"
-
-    def test_no_src_prefix_in_services(self):
-        """Service files should not have 'from src.' imports."""
-        services_dir = SRC_PATH / "services"
-        for py_file in services_dir.glob("*.py"):
-            content = py_file.read_text()
-            assert "from src." not in content, f"{py_file.name} contains 'from src.' import"
-            assert "import src." not in content, f"{py_file.name} contains 'import src.' import"
-
-    def test_no_src_prefix_in_models(self):
-        """Model files should not have 'from src.' imports."""
-        models_dir = SRC_PATH / "models"
-        for py_file in models_dir.glob("*.py"):
-            content = py_file.read_text()
-            assert "from src." not in content, f"{py_file.name} contains 'from src.' import"
-            assert "import src." not in content, f"{py_file.name} contains 'import src.' import"
-
-    def test_no_src_prefix_in_utils(self):
-        """Utility files should not have 'from src.' imports."""
-        utils_dir = SRC_PATH / "utils"
-        for py_file in utils_dir.glob("*.py"):
-            content = py_file.read_text()
-            assert "from src." not in content, f"{py_file.name} contains 'from src.' import"
-            assert "import src." not in content, f"{py_file.name} contains 'import src.' import"
+    @pytest.mark.parametrize("subdir", SRC_PREFIX_SUBDIRS)
+    def test_no_src_prefix(self, subdir: str, src_prefix_scan):
+        """Files in each src/ package should not have 'from src.' imports."""
+        assert src_prefix_scan[subdir] == []
@@ -1,9 +1,9 @@
-import json
-import os
+from unittest.mock import Mock
 
+import orjson
 import pytest
 
-from src.handlers import kb_sync
+from handlers import kb_sync
 
 
 @pytest.fixture(autouse=True)
@@ -13,31 +13,25 @@ def set_env(monkeypatch):
 
 
 def test_kb_sync_starts_ingestion(monkeypatch):
-    calls = {}
-
-    class FakeClient:
-        def start_ingestion_job(self, knowledgeBaseId, dataSourceId):
-            calls["kb"] = knowledgeBaseId
-            calls["ds"] = dataSourceId
-            return {"ingestionJob": {"ingestionJobId": "job-789"}}
-
-    monkeypatch.setattr(kb_sync, "client", FakeClient())
+    client = Mock(spec=["start_ingestion_job"])
+    client.start_ingestion_job.return_value = {"ingestionJob": {"ingestionJobId": "job-789"}}
+    monkeypatch.setattr(kb_sync, "_get_client", lambda: client)
 
     resp = kb_sync.lambda_handler({}, None)
     assert resp["statusCode"] == 200
-    body = json.loads(resp["body"])
+    body = orjson.loads(resp["body"])
     assert body["job_id"] == "job-789"
-    assert calls == {"kb": "kb-123", "ds": "ds-456"}
+    client.start_ingestion_job.assert_called_once_with(
+        knowledgeBaseId="kb-123", dataSourceId="ds-456"
+    )
 
 
 def test_kb_sync_handles_failure(monkeypatch):
-    class BoomClient:
-        def start_ingestion_job(self, knowledgeBaseId, dataSourceId):
-            raise RuntimeError("bedrock down")
-
-    monkeypatch.setattr(kb_sync, "client", BoomClient())
+    client = Mock(spec=["start_ingestion_job"])
+    client.start_ingestion_job.side_effect = RuntimeError("bedrock down")
+    monkeypatch.setattr(kb_sync, "_get_client", lambda: client)
 
     resp = kb_sync.lambda_handler({}, None)
     assert resp["statusCode"] == 500
-    body = json.loads(resp["body"])
+    body = orjson.loads(resp["body"])
     assert body["message"] == "KB sync failed"
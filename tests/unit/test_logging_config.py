@@ -0,0 +1,119 @@
+"""
+Tests for the JSON-lines logger.
+"""
+import io
+from contextlib import redirect_stdout
+from datetime import datetime
+
+import orjson
+import pytest
+
+from tests.fixtures.clock import FROZEN_NOW
+from utils.logging_config import JsonLogger
+
+
+def _records(capsysbinary):
+    """Parse every captured stdout line as one JSON record."""
+    return [orjson.loads(line) for line in capsysbinary.readouterr().out.splitlines()]
+
+
+@pytest.mark.parametrize(
+    "log_level, expected",
+    [
+        ("DEBUG", ["DEBUG", "INFO", "WARNING", "ERROR"]),
+        ("INFO", ["INFO", "WARNING", "ERROR"]),
+        ("warning", ["WARNING", "ERROR"]),
+        ("ERROR", ["ERROR"]),
+        ("bogus", ["INFO", "WARNING", "ERROR"]),
+    ],
+)
+def test_log_level_gates_output(monkeypatch, capsysbinary, log_level, expected):
+    """Records below LOG_LEVEL are dropped; unknown levels fall back to INFO."""
+    monkeypatch.setenv("LOG_LEVEL", log_level)
+    logger = JsonLogger("test")
+
+    logger.debug("d")
+    logger.info("i")
+    logger.warning("w")
+    logger.error("e")
+
+    assert [r["level"] for r in _records(capsysbinary)] == expected
+
+
+def test_record_merges_extra_then_fields(capsysbinary):
+    """extra= and keyword fields are merged in order, with keyword fields winning."""
+    logger = JsonLogger("svc", level="INFO")
+
+    logger.info(
+        "hello",
+        extra={"correlation_id": "cid", "shared": "extra"},
+        shared="field",
+        ticket_id="t-1",
+    )
+
+    (record,) = _records(capsysbinary)
+    assert record["level"] == "INFO"
+    assert record["msg"] == "hello"
+    assert record["name"] == "svc"
+    assert isinstance(record["ts"], float)
+    assert record["correlation_id"] == "cid"
+    assert record["ticket_id"] == "t-1"
+    assert record["shared"] == "field"
+
+
+def test_reserved_keys_cannot_be_overridden(capsysbinary):
+    """Caller values for level/name/msg/ts are kept under an extra_ prefix."""
+    logger = JsonLogger("svc", level="INFO")
+
+    logger.info("customer loaded", extra={"name": "Jane Doe", "level": "DEBUG"}, ts="later")
+
+    (record,) = _records(capsysbinary)
+    assert (record["level"], record["name"], record["msg"]) == ("INFO", "svc", "customer loaded")
+    assert isinstance(record["ts"], float)
+    assert record["extra_name"] == "Jane Doe"
+    assert record["extra_level"] == "DEBUG"
+    assert record["extra_ts"] == "later"
+
+
+def test_text_only_stdout_is_supported():
+    """Streams without a binary buffer receive the decoded line instead."""
+    logger = JsonLogger("svc", level="INFO")
+    stream = io.StringIO()
+
+    with redirect_stdout(stream):
+        logger.info("hello", ticket_id="t-1")
+
+    record = orjson.loads(stream.getvalue())
+    assert (record["msg"], record["ticket_id"]) == ("hello", "t-1")
+
+
+def test_exception_attaches_traceback(capsysbinary):
+    """exception() logs at ERROR with the active traceback in an 'exception' field."""
+    logger = JsonLogger("svc", level="INFO")
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed", extra={"ticket_id": "t-1"})
+
+    (record,) = _records(capsysbinary)
+    assert record["level"] == "ERROR"
+    assert record["ticket_id"] == "t-1"
+    assert record["exception"].startswith("Traceback (most recent call last):")
+    assert "ValueError: boom" in record["exception"]
+
+
+def test_unserializable_values_fall_back_to_str(capsysbinary):
+    """Objects orjson cannot encode are written via str() instead of raising."""
+    class Opaque:
+        def __str__(self):
+            return "opaque-value"
+
+    logger = JsonLogger("svc", level="INFO")
+
+    logger.info("mixed", extra={"obj": Opaque(), "when": FROZEN_NOW, "ids": {1}})
+
+    (record,) = _records(capsysbinary)
+    assert record["obj"] == "opaque-value"
+    assert datetime.fromisoformat(record["when"]) == FROZEN_NOW
+    assert record["ids"] == "{1}"
@@ -1,53 +1,55 @@
-import json
-
-from src.handlers import main
-
-
-def test_main_routes_health(monkeypatch):
-    monkeypatch.setattr(main.health_check, "lambda_handler", lambda e, c: {"status": "ok"})
-    event = {"requestContext": {"http": {"method": "GET", "path": "/health"}}}
-    resp = main.lambda_handler(event, None)
-    assert resp["status"] == "ok"
-
-
-def test_main_routes_ticket_ingestion(monkeypatch):
-    marker = {}
+import orjson
+import pytest
+
+from handlers import main
+
+
+def _event(method, path):
+    return {"requestContext": {"http": {"method": method, "path": path}}}
+
+
+@pytest.mark.parametrize(
+    "method, path, module_name, handler_name",
+    [
+        ("GET", "/health", "health_check", "lambda_handler"),
+        ("POST", "/tickets", "ticket_ingestion", "lambda_handler"),
+        ("GET", "/tickets/123/context", "customer_context", "lambda_handler"),
+        ("POST", "/tickets/123/feedback", "ticket_ingestion", "feedback_handler"),
+        ("POST", "/kb/sync", "kb_sync", "lambda_handler"),
+        ("POST", "/tickets/classify", "classification", "lambda_handler"),
+        ("POST", "/tickets/context", "retrieval", "lambda_handler"),
+        ("POST", "/tickets/respond", "response_generation", "lambda_handler"),
+        ("POST", "/tickets/auto-orchestrate", "orchestration", "lambda_handler"),
+    ],
+    ids=[
+        "health",
+        "ticket_ingestion",
+        "context",
+        "feedback",
+        "kb_sync",
+        "classify",
+        "retrieval",
+        "respond",
+        "auto_orchestrate",
+    ],
+)
+def test_main_routes(monkeypatch, method, path, module_name, handler_name):
+    calls = []
+    sentinel = {"statusCode": 200}
 
     def fake_handler(event, context):
-        marker["called"] = True
-        return {"statusCode": 200}
-
-    monkeypatch.setattr(main.ticket_ingestion, "lambda_handler", fake_handler)
-    event = {"requestContext": {"http": {"method": "POST", "path": "/tickets"}}}
-    resp = main.lambda_handler(event, None)
-    assert resp["statusCode"] == 200
-    assert marker["called"] is True
+        calls.append(event)
+        return sentinel
 
-
-def test_main_routes_context(monkeypatch):
-    monkeypatch.setattr(main.customer_context, "lambda_handler", lambda e, c: {"ok": True})
-    event = {"requestContext": {"http": {"method": "GET", "path": "/tickets/123/context"}}}
-    resp = main.lambda_handler(event, None)
-    assert resp["ok"] is True
-
-
-def test_main_routes_feedback(monkeypatch):
-    monkeypatch.setattr(main.ticket_ingestion, "feedback_handler", lambda e, c: {"fb": True})
-    event = {"requestContext": {"http": {"method": "POST", "path": "/tickets/123/feedback"}}}
+    monkeypatch.setattr(getattr(main, module_name), handler_name, fake_handler)
+    event = _event(method, path)
     resp = main.lambda_handler(event, None)
-    assert resp["fb"] is True
-
-
-def test_main_routes_kb_sync(monkeypatch):
-    monkeypatch.setattr(main.kb_sync, "lambda_handler", lambda e, c: {"sync": True})
-    event = {"requestContext": {"http": {"method": "POST", "path": "/kb/sync"}}}
-    resp = main.lambda_handler(event, None)
-    assert resp["sync"] is True
+    assert resp is sentinel
+    assert calls == [event]
 
 
 def test_main_unknown_route():
-    event = {"requestContext": {"http": {"method": "GET", "path": "/unknown"}}}
-    resp = main.lambda_handler(event, None)
+    resp = main.lambda_handler(_event("GET", "/unknown"), None)
     assert resp["statusCode"] == 404
-    body = json.loads(resp["body"])
+    body = orjson.loads(resp["body"])
     assert body["message"] == "Route not found"
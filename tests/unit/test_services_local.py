@@ -6,51 +6,130 @@ These tests validate service logic without connecting to AWS.
 Run with: pytest tests/unit/test_services_local.py -v
 """
 
-import sys
-import os
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+import io
+import json
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, patch
 
 import pytest
 
-# Add src to path to simulate Lambda environment
-SRC_PATH = Path(__file__).parent.parent.parent / "src"
-if str(SRC_PATH) not in sys.path:
-    sys.path.insert(0, str(SRC_PATH))
+from models.agent import (
+    Category,
+    ClassificationResult,
+    GenerationResult,
+    Priority,
+    ResponseDraft,
+    RetrievalContextItem,
+    RetrievalResult,
+    SafetyFlag,
+    Sentiment,
+    TicketInput,
+)
+from services import (
+    bedrock_service,
+    classification_service,
+    customer_service,
+    orchestration_service,
+    response_service,
+    retrieval_service,
+)
+from utils.cache_service import LRUCache
+from utils.error_handling import NotFoundError, to_response
+
+
+# Shared by the response-service tests; built once so enum values are resolved once.
+_TECHNICAL_CLASSIFICATION = ClassificationResult(
+    category=Category.TECHNICAL,
+    priority=Priority.MEDIUM,
+    department="Support",
+    sentiment=Sentiment.NEUTRAL,
+    confidence=0.85,
+    reasoning_snippet="Technical issue"
+)
+
+
+@pytest.fixture(scope="module")
+def _boto3_stub():
+    """Patch boto3 in every service module once for the whole module."""
+    with patch.object(classification_service, "boto3") as classification, \
+            patch.object(response_service, "boto3") as response, \
+            patch.object(bedrock_service, "boto3") as bedrock, \
+            patch.object(customer_service, "boto3") as customer:
+        yield SimpleNamespace(
+            classification=classification,
+            response=response,
+            bedrock=bedrock,
+            customer=customer,
+        )
 
 
+# (module, class name, entry-point method, {attribute: replacement}); DEFAULT
+# patches in a MagicMock, None resets a shared singleton for the test.
+_SERVICE_SURFACES = [
+    (classification_service, "ClassificationService", "classify", {}),
+    (
+        retrieval_service,
+        "RetrievalService",
+        "build_context",
+        {"CustomerService": DEFAULT, "BedrockService": DEFAULT},
+    ),
+    (response_service, "ResponseService", "generate_response", {}),
+    (
+        orchestration_service,
+        "OrchestrationService",
+        "run",
+        {
+            "ClassificationService": DEFAULT,
+            "RetrievalService": DEFAULT,
+            "ResponseService": DEFAULT,
+            "_classifier": None,
+            "_retriever": None,
+            "_responder": None,
+        },
+    ),
+    (
+        customer_service,
+        "CustomerService",
+        "get_customer_context",
+        {"get_db_engine": DEFAULT, "get_dynamodb": DEFAULT},
+    ),
+    (bedrock_service, "BedrockService", "retrieve", {}),
+]
+
+
+@pytest.mark.usefixtures("_boto3_stub")
+class TestServiceSurface:
+    """Every service should build offline and expose its entry point."""
+
+    @pytest.mark.parametrize(
+        "module, class_name, method, stubs",
+        _SERVICE_SURFACES,
+        ids=[surface[1] for surface in _SERVICE_SURFACES],
+    )
+    def test_service_instantiates_with_entry_point(self, module, class_name, method, stubs):
+        """Service should instantiate without errors and expose a callable entry point."""
+        service_cls = getattr(module, class_name)
+        assert callable(vars(service_cls).get(method))
+
+        with ExitStack() as stack:
+            for attribute, replacement in stubs.items():
+                stack.enter_context(patch.object(module, attribute, replacement))
+            assert isinstance(service_cls(), service_cls)
+
+
+@pytest.mark.usefixtures("_boto3_stub")
 class TestClassificationService:
     """Test ClassificationService."""
 
-    @patch("services.classification_service.boto3")
-    def test_service_instantiation(self, mock_boto3):
-        """Service should instantiate without errors."""
-        from services.classification_service import ClassificationService
-        
-        service = ClassificationService()
-        assert service is not None
+    def test_heuristic_fallback(self, monkeypatch):
+        """Service should have heuristic fallback for failed Bedrock calls."""
+        def _bedrock_unavailable(**kwargs):
+            raise Exception("Bedrock unavailable")
 
-    @patch("services.classification_service.boto3")
-    def test_service_has_classify_method(self, mock_boto3):
-        """Service should have classify method."""
-        from services.classification_service import ClassificationService
-        
-        service = ClassificationService()
-        assert hasattr(service, "classify")
-        assert callable(service.classify)
+        service = classification_service.ClassificationService()
+        monkeypatch.setattr(service.client, "invoke_model", _bedrock_unavailable)
 
-    @patch("services.classification_service.boto3")
-    def test_heuristic_fallback(self, mock_boto3):
-        """Service should have heuristic fallback for failed Bedrock calls."""
-        from services.classification_service import ClassificationService
-        from models.agent import TicketInput
-        
-        # Mock Bedrock to fail
-        mock_client = MagicMock()
-        mock_boto3.client.return_value = mock_client
-        mock_client.invoke_model.side_effect = Exception("Bedrock unavailable")
-        
-        service = ClassificationService()
         ticket = TicketInput(
             title="Billing question",
             description="I have a question about my bill",
@@ -66,125 +145,159 @@ class TestClassificationService:
 class TestRetrievalService:
     """Test RetrievalService."""
 
-    @patch("services.retrieval_service.CustomerService")
-    @patch("services.retrieval_service.BedrockService")
-    def test_service_instantiation(self, mock_bedrock, mock_customer):
-        """Service should instantiate without errors."""
-        from services.retrieval_service import RetrievalService
-        
-        service = RetrievalService()
-        assert service is not None
-
-    @patch("services.retrieval_service.CustomerService")
-    @patch("services.retrieval_service.BedrockService")
-    def test_service_has_build_context_method(self, mock_bedrock, mock_customer):
-        """Service should have build_context method."""
-        from services.retrieval_service import RetrievalService
-        
-        service = RetrievalService()
-        assert hasattr(service, "build_context")
-        assert callable(service.build_context)
+    @patch.object(retrieval_service, "CustomerService")
+    @patch.object(retrieval_service, "BedrockService")
+    def test_derive_sla_uses_priority_and_tier(self, mock_bedrock, mock_customer):
+        """SLA lookup should honour enum priorities and the enterprise tier."""
+        service = retrieval_service.RetrievalService()
+        assert service._derive_sla("standard", Priority.HIGH) == (
+            "SLA: 4h response, 1d resolution."
+        )
+        assert service._derive_sla("enterprise", Priority.CRITICAL) == (
+            "SLA: 1h response, 4h resolution. Expedite for enterprise tier."
+        )
+        assert service._derive_sla("standard", "unknown") == "SLA: 1d response."
+        assert service._derive_sla("enterprise", "unknown") == (
+            "SLA: 1d response. Expedite for enterprise tier."
+        )
+
+    def test_json_dumps_compact_omits_whitespace(self):
+        """Excerpts should use compact separators."""
+        order = {"order_id": "o-1", "items": [1, 2]}
+        assert retrieval_service.json_dumps_compact(order) == '{"order_id":"o-1","items":[1,2]}'
 
 
+@pytest.mark.usefixtures("_boto3_stub")
 class TestResponseService:
     """Test ResponseService."""
 
-    @patch("services.response_service.boto3")
-    def test_service_instantiation(self, mock_boto3):
-        """Service should instantiate without errors."""
-        from services.response_service import ResponseService
-        
-        service = ResponseService()
-        assert service is not None
+    def test_build_prompt_includes_context_and_classification(self):
+        """Prompt should embed the classification JSON and formatted context lines."""
+        classification = _TECHNICAL_CLASSIFICATION
+        retrieval = RetrievalResult(
+            context_package=[
+                RetrievalContextItem(
+                    source_id="kb-1",
+                    excerpt="Reset router",
+                    citation_uri="s3://kb/doc",
+                    score=0.9,
+                    type="kb",
+                )
+            ],
+            aggregate_confidence=0.8,
+        )
+        ticket = TicketInput(
+            title="VPN down",
+            description="Cannot connect",
+            customer_external_id="CUST001"
+        )
 
-    @patch("services.response_service.boto3")
-    def test_service_has_generate_response_method(self, mock_boto3):
-        """Service should have generate_response method."""
-        from services.response_service import ResponseService
-        
-        service = ResponseService()
-        assert hasattr(service, "generate_response")
-        assert callable(service.generate_response)
+        prompt = response_service.ResponseService()._build_prompt(ticket, classification, retrieval)
 
+        assert f"Classification: {classification.model_dump_json()}" in prompt
+        assert "- [kb] (0.90) Reset router (cite: s3://kb/doc)" in prompt
 
-class TestOrchestrationService:
-    """Test OrchestrationService."""
+        empty = RetrievalResult(context_package=[], aggregate_confidence=0.5)
+        prompt = response_service.ResponseService()._build_prompt(ticket, classification, empty)
+        assert "Context:\nNo context available." in prompt
 
-    @patch("services.orchestration_service.ClassificationService")
-    @patch("services.orchestration_service.RetrievalService")
-    @patch("services.orchestration_service.ResponseService")
-    def test_service_instantiation(self, mock_response, mock_retrieval, mock_classification):
-        """Service should instantiate without errors."""
-        from services.orchestration_service import OrchestrationService
-        
-        service = OrchestrationService()
-        assert service is not None
-
-    @patch("services.orchestration_service.ClassificationService")
-    @patch("services.orchestration_service.RetrievalService")
-    @patch("services.orchestration_service.ResponseService")
-    def test_service_has_run_method(self, mock_response, mock_retrieval, mock_classification):
-        """Service should have run method."""
-        from services.orchestration_service import OrchestrationService
-        
-        service = OrchestrationService()
-        assert hasattr(service, "run")
-        assert callable(service.run)
+        # The prompt must reflect the current field values, not an earlier serialization.
+        updated = classification.model_copy(update={"priority": Priority.LOW})
+        prompt = response_service.ResponseService()._build_prompt(ticket, updated, empty)
+        assert '"priority":"low"' in prompt
 
+    def test_parse_drafts_splits_on_separator(self):
+        """Drafts separated by --- should become primary and alternative drafts."""
+        service = response_service.ResponseService()
 
-class TestCustomerService:
-    """Test CustomerService."""
+        primary, alternative = service._parse_drafts("Draft one\n---\nDraft two")
+        assert primary.text == "Draft one"
+        assert alternative.text == "Draft two"
 
-    @patch("services.customer_service.get_db_engine")
-    @patch("services.customer_service.get_dynamodb")
-    @patch("services.customer_service.boto3")
-    def test_service_instantiation(self, mock_boto3, mock_ddb, mock_engine):
-        """Service should instantiate without errors."""
-        mock_engine.return_value = MagicMock()
-        mock_ddb.return_value = MagicMock()
-        
-        from services.customer_service import CustomerService
-        
-        # Need to set env for dynamodb table
-        with patch.dict(os.environ, {"INTERACTIONS_TABLE": "test-table"}):
-            service = CustomerService()
-            assert service is not None
-
-    @patch("services.customer_service.get_db_engine")
-    @patch("services.customer_service.get_dynamodb")
-    @patch("services.customer_service.boto3")
-    def test_service_has_get_customer_context_method(self, mock_boto3, mock_ddb, mock_engine):
-        """Service should have get_customer_context method."""
-        mock_engine.return_value = MagicMock()
-        mock_ddb.return_value = MagicMock()
-        
-        from services.customer_service import CustomerService
-        
-        with patch.dict(os.environ, {"INTERACTIONS_TABLE": "test-table"}):
-            service = CustomerService()
-            assert hasattr(service, "get_customer_context")
-            assert callable(service.get_customer_context)
+        primary, alternative = service._parse_drafts("Only draft")
+        assert primary.text == "Only draft"
+        assert alternative is None
 
+        # Empty segments from leading or repeated separators are skipped.
+        for text in ("---\nA\n---\nB", "A\n---\n---\nB"):
+            primary, alternative = service._parse_drafts(text)
+            assert (primary.text, alternative.text) == ("A", "B")
 
-class TestBedrockService:
-    """Test BedrockService."""
+    def test_guardrail_flags_guarantee_any_case(self, monkeypatch, bedrock_runtime_client):
+        """Drafts promising a guarantee should be flagged off-brand regardless of case."""
+        body = {"output": {"content": [{"text": "We GUARANTEE a fix today.\n---\nAlt"}]}}
+        # Per-test patch on the module-scoped stub, so later tests get a fresh client.
+        monkeypatch.setattr(
+            response_service.boto3, "client", lambda *args, **kwargs: bedrock_runtime_client
+        )
+        bedrock_runtime_client.invoke_model.return_value = {
+            "body": io.BytesIO(json.dumps(body).encode())
+        }
+
+        result = response_service.ResponseService().generate_response(
+            TicketInput(title="VPN", description="down", customer_external_id="CUST001"),
+            _TECHNICAL_CLASSIFICATION,
+            RetrievalResult(context_package=[], aggregate_confidence=0.5),
+        )
 
-    @patch("services.bedrock_service.boto3")
-    def test_service_instantiation(self, mock_boto3):
-        """Service should instantiate without errors."""
-        from services.bedrock_service import BedrockService
-        
-        service = BedrockService()
-        assert service is not None
+        assert result.guardrail_triggered is True
+        assert SafetyFlag.OFF_BRAND in result.primary_draft.safety_flags
 
-    @patch("services.bedrock_service.boto3")
-    def test_service_has_retrieve_method(self, mock_boto3):
-        """Service should have retrieve method."""
-        from services.bedrock_service import BedrockService
-        
-        service = BedrockService()
-        assert hasattr(service, "retrieve")
-        assert callable(service.retrieve)
+
+class TestOrchestrationService:
+    """Test OrchestrationService."""
+
+    @patch.object(orchestration_service, "ClassificationService")
+    @patch.object(orchestration_service, "RetrievalService")
+    @patch.object(orchestration_service, "ResponseService")
+    def test_stage_services_are_shared(
+        self, mock_response, mock_retrieval, mock_classification, monkeypatch
+    ):
+        """Rebuilding the orchestrator should reuse the same stage services."""
+        monkeypatch.setattr(orchestration_service, "_classifier", None)
+        monkeypatch.setattr(orchestration_service, "_retriever", None)
+        monkeypatch.setattr(orchestration_service, "_responder", None)
+
+        first = orchestration_service.OrchestrationService()
+        second = orchestration_service.OrchestrationService()
+
+        assert first.classifier is second.classifier
+        assert first.retriever is second.retriever
+        assert first.responder is second.responder
+        assert mock_classification.call_count == 1
+
+    @patch.object(retrieval_service, "CustomerService")
+    @patch.object(retrieval_service, "BedrockService")
+    @patch.object(orchestration_service, "ClassificationService")
+    @patch.object(orchestration_service, "ResponseService")
+    def test_run_skips_retrieval_calls_for_low_confidence(
+        self, mock_response, mock_classification, mock_bedrock, mock_customer, monkeypatch
+    ):
+        """Low-confidence tickets should reach no KB or customer lookups."""
+        monkeypatch.setattr(orchestration_service, "_classifier", None)
+        monkeypatch.setattr(orchestration_service, "_retriever", None)
+        monkeypatch.setattr(orchestration_service, "_responder", None)
+
+        mock_classification.return_value.classify.return_value = ClassificationResult(
+            category=Category.TECHNICAL,
+            priority=Priority.MEDIUM,
+            department="Support",
+            sentiment=Sentiment.NEUTRAL,
+            confidence=0.3,
+            reasoning_snippet="Test"
+        )
+        mock_response.return_value.generate_response.return_value = GenerationResult(
+            primary_draft=ResponseDraft(text="Hi", citations=[], confidence=0.6)
+        )
+        ticket = TicketInput(title="VPN", description="down", customer_external_id="CUST001")
+
+        result = orchestration_service.OrchestrationService().run(ticket, correlation_id="cid")
+
+        mock_bedrock.return_value.retrieve.assert_not_called()
+        mock_customer.return_value.get_customer_context.assert_not_called()
+        assert result.context.context_package == []
+        assert result.trace.correlation_id == "cid"
+        assert result.next_actions[-1] == "Escalate to L2 due to low retrieval confidence"
 
 
 class TestCacheService:
@@ -192,30 +305,22 @@ class TestCacheService:
 
     def test_cache_instantiation(self):
         """Cache should instantiate without errors."""
-        from utils.cache_service import LRUCache
-        
         cache = LRUCache(max_size=10, ttl_seconds=60)
         assert cache is not None
 
     def test_cache_set_and_get(self):
         """Cache should store and retrieve values."""
-        from utils.cache_service import LRUCache
-        
         cache = LRUCache(max_size=10, ttl_seconds=60)
         cache.set("key1", "value1")
         assert cache.get("key1") == "value1"
 
     def test_cache_miss(self):
         """Cache should return None for missing keys."""
-        from utils.cache_service import LRUCache
-        
         cache = LRUCache(max_size=10, ttl_seconds=60)
         assert cache.get("nonexistent") is None
 
     def test_cache_eviction(self):
         """Cache should evict oldest entries when full."""
-        from utils.cache_service import LRUCache
-        
         cache = LRUCache(max_size=2, ttl_seconds=60)
         cache.set("key1", "value1")
         cache.set("key2", "value2")
@@ -224,3 +329,92 @@ class TestCacheService:
         assert cache.get("key1") is None
         assert cache.get("key2") == "value2"
         assert cache.get("key3") == "value3"
+
+    def test_cache_get_refreshes_recency(self):
+        """Reading a key should protect it from the next eviction."""
+        cache = LRUCache(max_size=2, ttl_seconds=60)
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.get("key1")
+        cache.set("key3", "value3")  # Should evict key2, the least recently used
+
+        assert cache.get("key1") == "value1"
+        assert cache.get("key2") is None
+        assert cache.get("key3") == "value3"
+
+    def test_cache_overwrite_refreshes_without_evicting(self):
+        """Re-setting an existing key should update it in place, not evict."""
+        cache = LRUCache(max_size=2, ttl_seconds=60)
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.set("key1", "updated")
+        cache.set("key3", "value3")  # Should evict key2
+
+        assert cache.get("key1") == "updated"
+        assert cache.get("key2") is None
+        assert cache.stats()["size"] == 2
+
+    def test_cache_stats_count_hits_and_misses(self):
+        """Expired reads should count as misses alongside absent keys."""
+        clock = [0.0]
+        cache = LRUCache(max_size=10, ttl_seconds=60, time_fn=lambda: clock[0])
+        cache.set("key1", "value1")
+        cache.get("key1")
+        cache.get("missing")
+
+        clock[0] = 61.0
+        cache.get("key1")
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 2, 0)
+
+    def test_cache_entry_expires_after_ttl(self):
+        """Entries should expire once the clock passes their TTL, without sleeping."""
+        clock = [0.0]
+        cache = LRUCache(max_size=10, ttl_seconds=60, time_fn=lambda: clock[0])
+        cache.set("key1", "value1")
+
+        clock[0] = 60.0
+        assert cache.get("key1") == "value1"
+
+        clock[0] = 61.0
+        assert cache.get("key1") is None
+        assert cache.stats()["size"] == 0
+
+    def test_cache_overwrite_resets_ttl(self):
+        """Re-setting a key should restart its TTL."""
+        clock = [0.0]
+        cache = LRUCache(max_size=10, ttl_seconds=60, time_fn=lambda: clock[0])
+        cache.set("key1", "value1")
+
+        clock[0] = 50.0
+        cache.set("key1", "value2")
+
+        clock[0] = 100.0
+        assert cache.get("key1") == "value2"
+
+    def test_cache_bulk_inserts_stay_bounded(self):
+        """Evicting one entry per insert keeps the cache at max_size with the newest keys."""
+        cache = LRUCache(max_size=1000, ttl_seconds=60)
+        for i in range(50_000):
+            cache.set(f"key{i}", i)
+
+        assert cache.stats()["size"] == 1000
+        assert cache.stats()["evictions"] == 49_000
+        assert cache.get("key48999") is None
+        assert cache.get("key49000") == 49000
+        assert cache.get("key49999") == 49999
+
+
+class TestErrorHandling:
+    """Test error response helpers."""
+
+    def test_to_response_escapes_message(self):
+        """Error messages with quotes should still produce valid JSON."""
+        resp = to_response(NotFoundError('Ticket "T-1" not found'))
+
+        assert resp["statusCode"] == 404
+        assert json.loads(resp["body"]) == {
+            "message": 'Ticket "T-1" not found',
+            "status": "error",
+        }